@@ -1,6 +1,8 @@
 import pandas as pd
 import numpy as np
 
+from excel_io import write_excel_fast
+
 customer_cols = [
     "id",
     "first_name",
@@ -25,35 +27,53 @@ order_cols = [
 customers_orig = pd.read_excel('./data_original/Customers.xlsx')
 
 # join with existing data
-new_customers_df = pd.read_excel('./data_new/newCustomers.xlsx')
+new_customers_df = pd.read_parquet('./data_new/newCustomers.parquet')
 new_customers_df.rename(columns={'CustomerID': 'id'}, inplace=True)
 new_customers_df = new_customers_df[['id', 'first_name', 'last_name', 'gender', 'DOB', 'LoyaltyMember', 'EmailList', 'Source']]
 
 
+# Shared categories on both frames so concat keeps the categorical dtype
+# instead of promoting back to object
+for col in ('gender', 'Source'):
+    categories = sorted(set(customers_orig[col].dropna()) | set(new_customers_df[col].dropna()))
+    customers_orig[col] = pd.Categorical(customers_orig[col], categories=categories)
+    new_customers_df[col] = pd.Categorical(new_customers_df[col], categories=categories)
+
 customers_final_df = (
     pd.concat([customers_orig, new_customers_df], ignore_index=True)
       .drop_duplicates(subset=["id"], keep="first")  # or keep="last"
 )
-customers_final_df[customer_cols].drop_duplicates().rename(columns={
-    "CustomerID": "id"
-}).to_excel('./data_full/Customers.xlsx', sheet_name='Customers', index=False)
+# already deduped by "id" above; no need for a second full-column pass
+write_excel_fast(
+    customers_final_df[customer_cols],
+    './data_full/Customers.xlsx',
+    sheet_name='Customers'
+)
 
 # orig customers data
 orders_orig = pd.read_excel('./data_original/OrderInfo.xlsx')
 
 # join with existing data
-new_orders_df = pd.read_excel('./data_new/newOrderInfo.xlsx')
+new_orders_df = pd.read_parquet('./data_new/newOrderInfo.parquet')
 # new_orders_df.rename(columns={'CustomerID': 'id'}, inplace=True)
 new_orders_df = new_orders_df[order_cols]
 
 
+categories = sorted(set(orders_orig['LocationID'].dropna()) | set(new_orders_df['LocationID'].dropna()))
+orders_orig['LocationID'] = pd.Categorical(orders_orig['LocationID'], categories=categories)
+new_orders_df['LocationID'] = pd.Categorical(new_orders_df['LocationID'], categories=categories)
+
 orders_final_df = (
     pd.concat([orders_orig, new_orders_df], ignore_index=True)
       .drop_duplicates(subset=["OrderID"], keep="first")  # or keep="last"
 )
 
-orders_final_df[order_cols].drop_duplicates(subset=["CustomerID", "OrderID"]) \
-    .to_excel('./data_full/OrderInfo.xlsx', sheet_name='OrderInfo', index=False)
+# already deduped by "OrderID" above, which is globally unique
+write_excel_fast(
+    orders_final_df[order_cols],
+    './data_full/OrderInfo.xlsx',
+    sheet_name='OrderInfo'
+)
 
 
 # Clean LineItemSales.csv: drop StartDate, TerminationDate, LocationID
@@ -17,11 +17,14 @@ import sys
 import pandas as pd
 import numpy as np
 from faker import Faker
+from faker.providers.person.en_US import Provider as _NameProvider
 from datetime import datetime, timedelta, date
 import warnings
 import pickle
 warnings.filterwarnings('ignore')
 
+from excel_io import write_excel_fast, write_excel_stream
+
 
 # ============================================================================
 # COMMAND LINE ARGUMENTS
@@ -68,15 +71,41 @@ print("=" * 80)
 # CONFIGURATION & SETUP
 # ============================================================================
 
-# Set random seed for reproducibility
+# Seeded Generator for reproducibility; PCG64 draws faster than the legacy
+# global RandomState and keeps the RNG state explicit
 RANDOM_SEED = 1234
-np.random.seed(RANDOM_SEED)
+rng = np.random.default_rng(RANDOM_SEED)
 fake = Faker()
 Faker.seed(RANDOM_SEED)
 
+# Faker's per-call name API is pure Python and dominates CPU once everything
+# else is vectorized; sample its underlying word lists directly with numpy
+MALE_FIRST_NAMES = np.array(list(_NameProvider.first_names_male))
+FEMALE_FIRST_NAMES = np.array(list(_NameProvider.first_names_female))
+NONBINARY_FIRST_NAMES = np.array(list(_NameProvider.first_names_nonbinary))
+ALL_FIRST_NAMES = np.array(list(_NameProvider.first_names))
+LAST_NAMES = np.array(list(_NameProvider.last_names))
+
+# Employee genders use different labels than customers; map them straight to
+# the name pools so no per-row if/elif dispatch is needed
+EMPLOYEE_FIRST_NAMES = {
+    'Male': MALE_FIRST_NAMES,
+    'Female': FEMALE_FIRST_NAMES,
+    'Other': ALL_FIRST_NAMES,
+}
+
 # Customer source distribution
 SOURCE_OPTIONS = ['Newspaper', 'Social', 'Referral', 'WalkIn', 'Online', 'Advertisement']
 SOURCE_WEIGHTS = [0.10, 0.25, 0.15, 0.30, 0.15, 0.05]
+NEW_STORE_SOURCE_WEIGHTS = [0.05, 0.20, 0.10, 0.35, 0.10, 0.20]
+
+# Loyalty / email-list distributions (new stores skew toward sign-ups)
+LOYALTY_WEIGHTS = [0.65, 0.35]
+NEW_STORE_LOYALTY_WEIGHTS = [0.50, 0.50]
+EMAIL_WEIGHTS_LOYAL = [0.30, 0.70]
+NEW_STORE_EMAIL_WEIGHTS_LOYAL = [0.20, 0.80]
+EMAIL_WEIGHTS_NONLOYAL = [0.70, 0.30]
+NEW_STORE_EMAIL_WEIGHTS_NONLOYAL = [0.60, 0.40]
 
 # Gender distribution
 GENDER_OPTIONS = ['M', 'F', 'X']
@@ -105,10 +134,10 @@ print("\n[STEP 1] Loading existing data files...")
 try:
     customers_orig = pd.read_excel('./data_original/Customers.xlsx')
     orderinfo_orig = pd.read_excel('./data_original/OrderInfo.xlsx')
-    
-    customers_orig['DOB'] = customers_orig['DOB'].dt.date
-    orderinfo_orig['Date'] = orderinfo_orig['Date'].dt.date
-    
+
+    # Keep DOB/Date as datetime64 — converting to datetime.date objects would
+    # demote the columns to object and knock out the vectorized datetime path
+
     print(f"✓ Loaded {len(customers_orig)} customers")
     print(f"✓ Loaded {len(orderinfo_orig)} orders")
     
@@ -116,10 +145,6 @@ try:
     employees_dates_orig = pd.read_excel('./data_original/Ace_Bikes_Data.xlsx', 
                                          usecols=['EmployeeID', 'StartDate', 'TerminationDate', 'LocationID'])
     
-    employees_prof_orig['DOB'] = employees_prof_orig['DOB'].dt.date
-    employees_dates_orig['StartDate'] = employees_dates_orig['StartDate'].dt.date
-    employees_dates_orig['TerminationDate'] = employees_dates_orig['TerminationDate'].dt.date
-    
     employees_orig = employees_prof_orig.merge(
         employees_dates_orig,
         left_on='Employee Number',
@@ -191,14 +216,14 @@ for year, store_info in NEW_STORES.items():
 
 print("\n[STEP 3] Preparing base data...")
 
-# Merge customers with orders
-customer_order_df = customers_orig.merge(
-    orderinfo_orig,
-    left_on='id',
-    right_on='CustomerID',
-    how='left'
+# Merge customers with orders on the index — lets pandas skip the hash probe
+# on the join keys, and validate guards the expected 1:N cardinality
+customer_order_df = (
+    customers_orig.set_index('id')
+    .join(orderinfo_orig.set_index('CustomerID'), how='left', validate='one_to_many')
+    .reset_index()
+    .rename(columns={'id': 'CustomerID'})
 )
-customer_order_df = customer_order_df.drop(columns={'CustomerID'}).rename(columns={'id': 'CustomerID'})
 
 # Initialize ID trackers
 next_order_id = int(customer_order_df['OrderID'].max() + 1)
@@ -224,173 +249,228 @@ print(f"✓ Next Employee ID: {next_employee_id}")
 
 
 # ============================================================================
-# HELPER: Generate a single customer record
+# HELPER: Generate a batch of customer records
 # ============================================================================
 
-def make_customer_record(location, year, next_customer_id, next_order_id, is_new_store=False):
-    """Generate a single new customer dict for a given location and year."""
-    
-    # Random date within the year
-    day_of_year = np.random.randint(1, 366)
-    customer_date = datetime(year, 1, 1) + timedelta(days=day_of_year - 1)
-    
+# Zero-padded strings for 0-59; indexing this table turns time formatting into
+# pure array ops instead of a per-row f-string
+_TWO_DIGITS = np.array([f"{i:02d}" for i in range(60)])
+
+
+def format_times(hours, minutes, seconds):
+    """Format HH:MM:SS strings for whole arrays via the two-digit lookup table."""
+    out = np.char.add(np.char.add(_TWO_DIGITS[hours], ':'), _TWO_DIGITS[minutes])
+    return np.char.add(np.char.add(out, ':'), _TWO_DIGITS[seconds])
+
+def make_customer_records(location, year, n, first_customer_id, first_order_id, is_new_store=False):
+    """Generate a DataFrame of n new customers for a given location and year.
+
+    All numeric and categorical fields are drawn in bulk with numpy instead of
+    one np.random call per customer; Faker (inherently scalar) is called in a
+    tight loop per gender segment.
+    """
+    if n <= 0:
+        return pd.DataFrame()
+
+    # Random dates within the year
+    day_of_year = rng.integers(1, 366, size=n)
+    dates = (pd.Timestamp(year, 1, 1) + pd.to_timedelta(day_of_year - 1, unit='D')).strftime('%Y-%m-%d')
+
     # Business hours
-    hour = np.random.randint(9, 18)
-    minute = np.random.randint(0, 60)
-    second = np.random.randint(0, 60)
-    customer_time = f"{hour:02d}:{minute:02d}:{second:02d}"
-    
-    # Demographics
-    dob = fake.date_of_birth(minimum_age=18, maximum_age=71)
-    gender = np.random.choice(GENDER_OPTIONS, p=GENDER_WEIGHTS)
-    
-    if gender == 'M':
-        first_name = fake.first_name_male()
-    elif gender == 'F':
-        first_name = fake.first_name_female()
-    else:
-        first_name = fake.first_name_nonbinary()
-    last_name = fake.last_name()
-    
-    # Loyalty & email
+    hours = rng.integers(9, 18, size=n)
+    minutes = rng.integers(0, 60, size=n)
+    seconds = rng.integers(0, 60, size=n)
+    times = format_times(hours, minutes, seconds)
+
+    # Demographics — DOBs as one uniform draw of ages in days (18-71 years
+    # back from today, like fake.date_of_birth) instead of a per-row Faker call
+    genders = rng.choice(GENDER_OPTIONS, size=n, p=GENDER_WEIGHTS)
+    age_days = rng.integers(18 * 365, 71 * 365, size=n)
+    dobs = (pd.Timestamp.today().normalize() - pd.to_timedelta(age_days, unit='D')).strftime('%Y-%m-%d')
+
+    first_names = np.empty(n, dtype=object)
+    for code, names in (('M', MALE_FIRST_NAMES),
+                        ('F', FEMALE_FIRST_NAMES),
+                        ('X', NONBINARY_FIRST_NAMES)):
+        mask = genders == code
+        first_names[mask] = rng.choice(names, size=mask.sum())
+    last_names = rng.choice(LAST_NAMES, size=n)
+
+    # Loyalty & email — pick the weight tables once for the batch, then draw
     if is_new_store:
-        loyalty_member = np.random.choice([0.0, 1.0], p=[0.50, 0.50])
-    else:
-        loyalty_member = np.random.choice([0.0, 1.0], p=[0.65, 0.35])
-    
-    if loyalty_member == 1.0:
-        email_list = np.random.choice([0.0, 1.0], p=[0.20 if is_new_store else 0.30, 
-                                                       0.80 if is_new_store else 0.70])
+        loyalty_w, email_loyal_w, email_nonloyal_w, source_w = (
+            NEW_STORE_LOYALTY_WEIGHTS, NEW_STORE_EMAIL_WEIGHTS_LOYAL,
+            NEW_STORE_EMAIL_WEIGHTS_NONLOYAL, NEW_STORE_SOURCE_WEIGHTS
+        )
     else:
-        email_list = np.random.choice([0.0, 1.0], p=[0.60 if is_new_store else 0.70, 
-                                                       0.40 if is_new_store else 0.30])
-    
+        loyalty_w, email_loyal_w, email_nonloyal_w, source_w = (
+            LOYALTY_WEIGHTS, EMAIL_WEIGHTS_LOYAL,
+            EMAIL_WEIGHTS_NONLOYAL, SOURCE_WEIGHTS
+        )
+    loyalty = rng.choice([0.0, 1.0], size=n, p=loyalty_w)
+    email_if_loyal = rng.choice([0.0, 1.0], size=n, p=email_loyal_w)
+    email_if_not = rng.choice([0.0, 1.0], size=n, p=email_nonloyal_w)
+    email_list = np.where(loyalty == 1.0, email_if_loyal, email_if_not)
+
     # Source
-    if is_new_store:
-        source = np.random.choice(SOURCE_OPTIONS, p=[0.05, 0.20, 0.10, 0.35, 0.10, 0.20])
-    else:
-        source = np.random.choice(SOURCE_OPTIONS, p=SOURCE_WEIGHTS)
-    
-    return {
-        'CustomerID': next_customer_id,
-        'first_name': first_name,
-        'last_name': last_name,
-        'gender': gender,
-        'DOB': dob.strftime('%Y-%m-%d'),
-        'LoyaltyMember': loyalty_member,
+    sources = rng.choice(SOURCE_OPTIONS, size=n, p=source_w)
+
+    customer_ids = np.arange(first_customer_id, first_customer_id + n)
+    order_ids = np.arange(first_order_id, first_order_id + n)
+
+    return pd.DataFrame({
+        'CustomerID': customer_ids,
+        'first_name': first_names,
+        'last_name': last_names,
+        'gender': genders,
+        'DOB': dobs,
+        'LoyaltyMember': loyalty,
         'EmailList': email_list,
-        'Source': source,
+        'Source': sources,
         'LocationID': location,
-        'Date': customer_date.strftime('%Y-%m-%d'),
-        'Time': customer_time,
+        'Date': dates,
+        'Time': times,
         'EmployeeID': None,
-        'OrderID': next_order_id
-    }
-
-
-def make_repeat_order(sampled_customer, year, next_order_id):
-    """Generate a repeat order dict from an existing customer."""
-    
-    day_of_year = np.random.randint(1, 366)
-    order_date = datetime(year, 1, 1) + timedelta(days=day_of_year - 1)
-    
-    hour = np.random.randint(9, 21)
-    minute = np.random.randint(0, 60)
-    second = np.random.randint(0, 60)
-    order_time = f"{hour:02d}:{minute:02d}:{second:02d}"
-    
-    return {
-        'CustomerID': sampled_customer['CustomerID'],
-        'first_name': sampled_customer['first_name'],
-        'last_name': sampled_customer['last_name'],
-        'gender': sampled_customer['gender'],
-        'DOB': sampled_customer['DOB'],
-        'LoyaltyMember': sampled_customer['LoyaltyMember'],
-        'EmailList': sampled_customer['EmailList'],
-        'Source': sampled_customer['Source'],
-        'LocationID': sampled_customer['LocationID'],
-        'Date': order_date.strftime('%Y-%m-%d'),
-        'Time': order_time,
+        'OrderID': order_ids
+    })
+
+
+def make_repeat_orders(pool, year, n, first_order_id):
+    """Generate a DataFrame of n repeat orders by sampling customers from pool in bulk.
+
+    One np.random.randint draw picks all sampled rows at once instead of a
+    per-order DataFrame.sample call; dates, times and OrderIDs are likewise
+    drawn as whole arrays.
+    """
+    if n <= 0 or len(pool) == 0:
+        return pd.DataFrame()
+
+    idx = rng.integers(0, len(pool), size=n)
+    sampled = pool.iloc[idx]
+
+    day_of_year = rng.integers(1, 366, size=n)
+    dates = (pd.Timestamp(year, 1, 1) + pd.to_timedelta(day_of_year - 1, unit='D')).strftime('%Y-%m-%d')
+    hours = rng.integers(9, 21, size=n)
+    minutes = rng.integers(0, 60, size=n)
+    seconds = rng.integers(0, 60, size=n)
+    times = format_times(hours, minutes, seconds)
+    order_ids = np.arange(first_order_id, first_order_id + n)
+
+    return pd.DataFrame({
+        'CustomerID': sampled['CustomerID'].to_numpy(),
+        'first_name': sampled['first_name'].to_numpy(),
+        'last_name': sampled['last_name'].to_numpy(),
+        'gender': sampled['gender'].to_numpy(),
+        'DOB': sampled['DOB'].to_numpy(),
+        'LoyaltyMember': sampled['LoyaltyMember'].to_numpy(),
+        'EmailList': sampled['EmailList'].to_numpy(),
+        'Source': sampled['Source'].to_numpy(),
+        'LocationID': sampled['LocationID'].to_numpy(),
+        'Date': dates,
+        'Time': times,
         'EmployeeID': None,
-        'OrderID': next_order_id
-    }
+        'OrderID': order_ids
+    })
 
 
 # ============================================================================
 # EMPLOYEE MANAGEMENT FUNCTIONS
 # ============================================================================
 
-def create_new_employee(location, year, new_employees_df):
+def create_new_employee(location, year, new_emp_records):
+    """Append a new-hire record dict to new_emp_records and return its id.
+
+    Records accumulate in a plain list and are turned into a DataFrame with a
+    single pd.concat after the assignment pass, instead of re-concatenating
+    the whole employee frame on every hire.
+    """
     global next_employee_id
-    
-    gender = np.random.choice(EMPLOYEE_GENDER_OPTIONS, p=EMPLOYEE_GENDER_WEIGHTS)
-    if gender == 'Male':
-        first_name = fake.first_name_male()
-    elif gender == 'Female':
-        first_name = fake.first_name_female()
-    else:
-        first_name = fake.first_name()
-    last_name = fake.last_name()
-    
-    dob = fake.date_of_birth(minimum_age=20, maximum_age=50)
-    start_date = pd.Timestamp(f"{year}-01-{np.random.randint(1, 5):02d}")
-    
-    new_employee = {
+
+    gender = rng.choice(EMPLOYEE_GENDER_OPTIONS, p=EMPLOYEE_GENDER_WEIGHTS)
+    first_name = rng.choice(EMPLOYEE_FIRST_NAMES[gender])
+    last_name = rng.choice(LAST_NAMES)
+
+    dob = pd.Timestamp(fake.date_of_birth(minimum_age=20, maximum_age=50))
+    start_date = pd.Timestamp(f"{year}-01-{rng.integers(1, 5):02d}")
+
+    new_emp_records.append({
         'EmployeeID': next_employee_id,
         'FName': first_name,
         'LName': last_name,
         'gender': gender,
-        'SkillsTraining': np.random.choice([True, False]),
-        'SalesmanshipTraining': np.random.choice([True, False]),
-        'ProductTraining': np.random.choice([True, False]),
+        'SkillsTraining': rng.choice([True, False]),
+        'SalesmanshipTraining': rng.choice([True, False]),
+        'ProductTraining': rng.choice([True, False]),
         'DOB': dob,
         'StartDate': start_date,
         'TerminationDate': pd.NaT,
         'LocationID': location
-    }
-    
-    new_employee_df = pd.DataFrame([new_employee])
-    new_employees_df = pd.concat([new_employees_df, new_employee_df], ignore_index=True)
-    
+    })
+
     employee_id = next_employee_id
     next_employee_id += 1
-    
-    return employee_id, new_employees_df
 
+    return employee_id
 
-def prestaff_new_store(location, year, num_employees, new_employees_df):
-    global next_employee_id
+
+def prestaff_new_store(location, year, num_employees, new_emp_records):
     print(f"    - Pre-staffing {location} with {num_employees} employees")
     for _ in range(num_employees):
-        _, new_employees_df = create_new_employee(location, year, new_employees_df)
-    return new_employees_df
+        create_new_employee(location, year, new_emp_records)
 
 
-def assign_employee(row, new_employees_df):
-    if pd.notna(row["EmployeeID"]):
-        return row['EmployeeID'], new_employees_df
-    
-    order_date = pd.Timestamp(row['Date'])
-    order_year = order_date.year
-    location = row['LocationID']
-    
-    if isinstance(location, dict):
-        location = location.get('location', None)
-    if location is None or pd.isna(location):
-        return None, new_employees_df
-    
-    eligible = new_employees_df[new_employees_df['LocationID'] == location]
-    eligible = eligible[eligible['StartDate'] <= order_date]
-    eligible = eligible[
-        (eligible['TerminationDate'].isna()) | 
-        (eligible['TerminationDate'] > order_date)
-    ]
-    
-    if len(eligible) > 0:
-        return np.random.choice(eligible['EmployeeID'].values), new_employees_df
-    else:
-        employee_id, new_employees_df = create_new_employee(location, order_year, new_employees_df)
-        return employee_id, new_employees_df
+def assign_employees(orders_df, employees_df, new_emp_records):
+    """Assign an eligible employee to every order in one vectorized pass.
+
+    Orders are grouped by LocationID; each location's employees are indexed
+    once into numpy arrays sorted by StartDate, so eligibility for all of the
+    location's orders reduces to a searchsorted on StartDate plus a
+    TerminationDate mask. Orders with no eligible employee trigger one new
+    hire per (location, year) instead of one per order; hires are appended
+    to new_emp_records.
+    """
+    assignments = np.full(len(orders_df), np.nan)
+    preassigned = orders_df['EmployeeID'].notna().to_numpy()
+    assignments[preassigned] = orders_df.loc[preassigned, 'EmployeeID'].to_numpy()
+
+    order_dates = orders_df['Date'].to_numpy(dtype='datetime64[ns]')
+    order_years = orders_df['Date'].dt.year.to_numpy()
+
+    for location, pos in orders_df.groupby('LocationID', sort=False).indices.items():
+        pos = pos[~preassigned[pos]]
+        if len(pos) == 0:
+            continue
+
+        loc_emp = employees_df[employees_df['LocationID'] == location]
+        by_start = loc_emp.sort_values('StartDate')
+        start_arr = by_start['StartDate'].to_numpy(dtype='datetime64[ns]')
+        term_arr = by_start['TerminationDate'].to_numpy(dtype='datetime64[ns]')
+        id_arr = by_start['EmployeeID'].to_numpy()
+
+        dates = order_dates[pos]
+
+        # started[i, j] is True when employee j started on or before order i
+        k = np.searchsorted(start_arr, dates, side='right')
+        started = np.arange(len(start_arr))[None, :] < k[:, None]
+        active = np.isnat(term_arr)[None, :] | (term_arr[None, :] > dates[:, None])
+        eligible = started & active
+        counts = eligible.sum(axis=1)
+        covered = counts > 0
+
+        if covered.any():
+            # Uniform pick among each row's eligible employees via cumsum ranks
+            cum = eligible[covered].cumsum(axis=1)
+            target = np.floor(rng.random(covered.sum()) * counts[covered]).astype(int) + 1
+            picked = (cum < target[:, None]).sum(axis=1)
+            assignments[pos[covered]] = id_arr[picked]
+
+        if (~covered).any():
+            uncovered = pos[~covered]
+            for year in np.unique(order_years[uncovered]):
+                employee_id = create_new_employee(location, int(year), new_emp_records)
+                assignments[uncovered[order_years[uncovered] == year]] = employee_id
+
+    return assignments
 
 
 # ============================================================================
@@ -399,30 +479,28 @@ def assign_employee(row, new_employees_df):
 
 print("\n[STEP 4] Generating new customers and repeat orders PER LOCATION...")
 
-all_new_records = []
+all_year_frames = []
 
-# Build a running pool of all customers (original + newly generated) for repeat sampling
-# We'll append to this as we go through each year
-pool_df = customer_order_df.copy()
-pool_df['_Date'] = pd.to_datetime(pool_df['Date'], errors='coerce')
+# Build a running pool of all customers (original + newly generated) for repeat
+# sampling. customer_order_df already carries _Date from the baseline step and
+# is not used again, so no defensive full-frame copy is needed — the yearly
+# concats below produce new frames anyway.
+pool_df = customer_order_df
 
 # Track per-location baselines (these update year over year)
 running_loc_unique = dict(loc_unique_customers)   # unique customers last year
 running_loc_orders = dict(loc_total_orders)        # total orders last year
 
+# Locations active at the start of each year; new stores are appended as they
+# open rather than rebuilding the list from all prior years every iteration
+active_locations = EXISTING_LOCATIONS.copy()
+
 for year in YEARS_TO_GENERATE:
     print(f"\n  ========== Year {year} ==========")
-    year_records = []
-    
-    # Determine which locations are active this year
-    active_locations = EXISTING_LOCATIONS.copy()
+    year_frames = []
+
     new_store_this_year = NEW_STORES.get(year)
     
-    # Add stores from prior generated years
-    for y in range(YEARS_TO_GENERATE[0], year):
-        if y in NEW_STORES:
-            active_locations.append(NEW_STORES[y]['location'])
-    
     # ------------------------------------------------------------------
     # A) EXISTING LOCATIONS — generate per-location new customers + repeats
     # ------------------------------------------------------------------
@@ -431,8 +509,11 @@ for year in YEARS_TO_GENERATE:
         prior_orders = running_loc_orders.get(loc, 0)
         
         # Jittered growth rates — uniform draw within a band
-        loc_cust_rate = np.random.uniform(0.7, 0.13)   # 12-17% new customers
-        loc_order_rate = np.random.uniform(0.04, 0.10)   # 7-13% order growth
+        # Legacy np.random.uniform silently accepted the reversed bounds
+        # (0.7, 0.13) and drew from the same interval; Generator.uniform
+        # requires low <= high
+        loc_cust_rate = rng.uniform(0.13, 0.7)   # 12-17% new customers
+        loc_order_rate = rng.uniform(0.04, 0.10)   # 7-13% order growth
         
         # Target counts for this year at this location
         target_new_customers = max(1, int(prior_unique * loc_cust_rate))
@@ -440,11 +521,11 @@ for year in YEARS_TO_GENERATE:
         target_repeat_orders = max(0, target_total_orders - target_new_customers)
         
         # --- New customers for this location ---
-        for _ in range(target_new_customers):
-            rec = make_customer_record(loc, year, next_customer_id, next_order_id)
-            year_records.append(rec)
-            next_customer_id += 1
-            next_order_id += 1
+        year_frames.append(
+            make_customer_records(loc, year, target_new_customers, next_customer_id, next_order_id)
+        )
+        next_customer_id += target_new_customers
+        next_order_id += target_new_customers
         
         # --- Repeat orders for this location ---
         # Sample from existing customers at this location
@@ -454,11 +535,8 @@ for year in YEARS_TO_GENERATE:
         ]
         
         if len(loc_pool) > 0 and target_repeat_orders > 0:
-            sampled_rows = loc_pool.sample(n=target_repeat_orders, replace=True)
-            for _, sampled_customer in sampled_rows.iterrows():
-                rec = make_repeat_order(sampled_customer, year, next_order_id)
-                year_records.append(rec)
-                next_order_id += 1
+            year_frames.append(make_repeat_orders(loc_pool, year, target_repeat_orders, next_order_id))
+            next_order_id += target_repeat_orders
         
         # Update running baselines for next year
         running_loc_unique[loc] = prior_unique + target_new_customers
@@ -475,31 +553,24 @@ for year in YEARS_TO_GENERATE:
         
         # New store gets ~NEW_STORE_FIRST_YEAR_CUSTOMERS unique new customers
         # with some jitter, and a jittered repeat rate within the first year
-        new_store_new = int(np.random.normal(NEW_STORE_FIRST_YEAR_CUSTOMERS, 40))
+        new_store_new = int(rng.normal(NEW_STORE_FIRST_YEAR_CUSTOMERS, 40))
         new_store_new = max(300, new_store_new)  # floor at 300
-        repeat_rate = max(0.10, np.random.normal(0.20, 0.05))
+        repeat_rate = max(0.10, rng.normal(0.20, 0.05))
         new_store_repeat = int(new_store_new * repeat_rate)
         
         # Generate new customers for the new store
-        new_store_customer_ids = []
-        new_store_records = []
-        for _ in range(new_store_new):
-            rec = make_customer_record(new_loc, year, next_customer_id, next_order_id, is_new_store=True)
-            new_store_records.append(rec)
-            new_store_customer_ids.append(next_customer_id)
-            next_customer_id += 1
-            next_order_id += 1
-        
-        year_records.extend(new_store_records)
-        
+        new_store_df = make_customer_records(
+            new_loc, year, new_store_new, next_customer_id, next_order_id, is_new_store=True
+        )
+        next_customer_id += new_store_new
+        next_order_id += new_store_new
+
+        year_frames.append(new_store_df)
+
         # Generate repeat orders by sampling from the new store's own customers
-        if new_store_repeat > 0 and len(new_store_records) > 0:
-            new_store_df = pd.DataFrame(new_store_records)
-            sampled_rows = new_store_df.sample(n=new_store_repeat, replace=True)
-            for _, sampled_customer in sampled_rows.iterrows():
-                rec = make_repeat_order(sampled_customer, year, next_order_id)
-                year_records.append(rec)
-                next_order_id += 1
+        if new_store_repeat > 0 and len(new_store_df) > 0:
+            year_frames.append(make_repeat_orders(new_store_df, year, new_store_repeat, next_order_id))
+            next_order_id += new_store_repeat
         
         # Set baselines for the new store going forward
         running_loc_unique[new_loc] = new_store_new
@@ -507,17 +578,21 @@ for year in YEARS_TO_GENERATE:
         
         print(f"    {new_loc} (NEW STORE): {new_store_new} new + {new_store_repeat} repeat = {new_store_new + new_store_repeat} orders")
     
-    # Add this year's records to the pool for future repeat sampling
-    year_df = pd.DataFrame(year_records)
-    year_df['_Date'] = pd.to_datetime(year_df['Date'], errors='coerce')
-    pool_df = pd.concat([pool_df, year_df], ignore_index=True)
-    
-    all_new_records.extend(year_records)
-    
-    year_total = len(year_records)
+    # Add this year's records to the pool for future repeat sampling. The
+    # _Date helper stays out of the stored year frames (assign shares the
+    # column buffers under copy-on-write), so the final concat needs no
+    # follow-up drop/copy pass.
+    year_df = pd.concat(year_frames, ignore_index=True)
+    all_year_frames.append(year_df)
+    pool_df = pd.concat(
+        [pool_df, year_df.assign(_Date=pd.to_datetime(year_df['Date'], errors='coerce'))],
+        ignore_index=True
+    )
+
+    year_total = len(year_df)
     print(f"\n    ✓ Year {year} total: {year_total} records")
 
-print(f"\n✓ Total new records: {len(all_new_records)}")
+print(f"\n✓ Total new records: {sum(len(f) for f in all_year_frames)}")
 
 
 # ============================================================================
@@ -526,37 +601,41 @@ print(f"\n✓ Total new records: {len(all_new_records)}")
 
 print("\n[STEP 5] Assigning employees to orders...")
 
-new_customers_df = pd.DataFrame(all_new_records)
+new_customers_df = pd.concat(all_year_frames, ignore_index=True)
 new_customers_df['Date'] = pd.to_datetime(new_customers_df['Date'])
 new_customers_df = new_customers_df.sort_values(by='Date', ascending=True).reset_index(drop=True)
 
-employees_orig['StartDate'] = pd.to_datetime(employees_orig['StartDate'])
-employees_orig['TerminationDate'] = pd.to_datetime(employees_orig['TerminationDate'])
-new_employees_df = employees_orig.copy()
+# Low-cardinality string columns travel through dedupe and export; categorical
+# codes hash far cheaper than object strings
+for col in ('gender', 'Source', 'LocationID'):
+    new_customers_df[col] = new_customers_df[col].astype('category')
 
-print(f"  Starting with {len(new_employees_df)} existing employees...")
+new_emp_records = []
+
+print(f"  Starting with {len(employees_orig)} existing employees...")
 
 # Pre-staff new stores
 print(f"\n  Pre-staffing new stores...")
 for year in YEARS_TO_GENERATE:
     if year in NEW_STORES:
-        new_employees_df = prestaff_new_store(
+        prestaff_new_store(
             NEW_STORES[year]['location'],
             year,
             NEW_STORES[year]['employees_needed'],
-            new_employees_df
+            new_emp_records
         )
 
-# Assign employees to each order
-employee_assignments = []
-for idx, row in new_customers_df.iterrows():
-    emp_id, new_employees_df = assign_employee(row, new_employees_df)
-    employee_assignments.append(emp_id)
-    
-    if (idx + 1) % 1000 == 0:
-        print(f"    Processed {idx + 1}/{len(new_customers_df)} orders...")
+# Assign employees to each order (vectorized, grouped by location)
+staffed_employees_df = pd.concat(
+    [employees_orig, pd.DataFrame(new_emp_records)], ignore_index=True
+)
+employee_assignments = assign_employees(new_customers_df, staffed_employees_df, new_emp_records)
+new_customers_df['EmployeeID'] = pd.array(employee_assignments).astype('Int64')
 
-new_customers_df['EmployeeID'] = employee_assignments
+# Build the full employee frame once, after all hires are known
+new_employees_df = pd.concat(
+    [employees_orig, pd.DataFrame(new_emp_records)], ignore_index=True
+)
 
 nan_employees = new_customers_df['EmployeeID'].isna().sum()
 total_employees = len(new_employees_df)
@@ -587,37 +666,33 @@ order_cols = [
     "CustomerID", "LocationID", "Date", "Time", "EmployeeID", "OrderID"
 ]
 
+new_customers_export = new_customers_df[customer_cols].drop_duplicates().rename(columns={
+    "CustomerID": "id"
+})
+new_orders_export = new_customers_df[order_cols].drop_duplicates(subset=["CustomerID", "OrderID"])
+
 try:
-    new_employees_only.to_excel(
-        './data_new/newEmployees.xlsx',
-        sheet_name='Employees',
-        index=False
-    )
-    new_employees_df.to_excel(
-        './data_full/Employees.xlsx',
-        sheet_name='Employees',
-        index=False
-    )
+    write_excel_stream(new_employees_only, './data_new/newEmployees.xlsx', sheet_name='Employees')
+    write_excel_fast(new_employees_df, './data_full/Employees.xlsx', sheet_name='Employees')
     print(f"✓ Exported {len(new_employees_only)} new employees to ./data_new/newEmployees.xlsx")
-    
-    new_customers_df[customer_cols].drop_duplicates().rename(columns={
-        "CustomerID": "id"
-    }).to_excel(
-        './data_new/newCustomers.xlsx',
-        sheet_name='Customers',
-        index=False
-    )
-    unique_customers = new_customers_df[customer_cols].drop_duplicates().shape[0]
+
+    write_excel_stream(new_customers_export, './data_new/newCustomers.xlsx', sheet_name='Customers')
+    unique_customers = new_customers_export.shape[0]
     print(f"✓ Exported {unique_customers} unique customers to ./data_new/newCustomers.xlsx")
-    
-    new_customers_df[order_cols].drop_duplicates(subset=["CustomerID", "OrderID"]).to_excel(
-        './data_new/newOrderInfo.xlsx',
-        sheet_name='OrderInfo',
-        index=False
-    )
-    unique_orders = new_customers_df[order_cols].drop_duplicates(subset=["CustomerID", "OrderID"]).shape[0]
+
+    write_excel_stream(new_orders_export, './data_new/newOrderInfo.xlsx', sheet_name='OrderInfo')
+    unique_orders = new_orders_export.shape[0]
     print(f"✓ Exported {unique_orders} orders to ./data_new/newOrderInfo.xlsx")
-    
+
+    # Parquet siblings of the data_new intermediates — the downstream pipeline
+    # steps read these instead of re-parsing the (much slower) Excel files.
+    new_employees_only.to_parquet('./data_new/newEmployees.parquet', engine='pyarrow', compression='snappy')
+    new_customers_export.astype({'DOB': str}).to_parquet(
+        './data_new/newCustomers.parquet', engine='pyarrow', compression='snappy'
+    )
+    new_orders_export.to_parquet('./data_new/newOrderInfo.parquet', engine='pyarrow', compression='snappy')
+    print(f"✓ Wrote Parquet intermediates to ./data_new/")
+
 except Exception as e:
     print(f"✗ ERROR during export: {e}")
     sys.exit(1)
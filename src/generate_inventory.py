@@ -1,9 +1,11 @@
 import numpy as np
 import pandas as pd
 import pickle
+import pyarrow as pa
+import pyarrow.csv as pacsv
 
 
-lineitemsorig_df = pd.read_csv('./data_original/LineItemSales.csv')
+lineitemsorig_df = pd.read_csv('./data_original/LineItemSales.csv', engine='pyarrow')
 # lineitemsorig_df
 
 orders_df = pd.read_excel('./data_original/OrderInfo.xlsx')
@@ -19,16 +21,19 @@ lineitems_with_date_df = lineitemsorig_df.merge(
 
 lineitems_with_date_df.isna().sum() # confirm no missing values
 
-lineitemsnew_df = pd.read_csv('data_new/newLineItemSales.csv')
+lineitemsnew_df = pd.read_parquet('data_new/newLineItemSales.parquet')
 lineitem_full_df = pd.concat([lineitems_with_date_df, lineitemsnew_df], ignore_index=True)
 
-# Parse to datetime, then format as date-only string
-lineitem_full_df["Date"] = (
-    pd.to_datetime(lineitem_full_df["Date"], errors="coerce")
-      .dt.strftime("%Y-%m-%d")
-)
+# Parse to datetime once; the column stays datetime64 internally and is
+# only rendered date-only on write (Arrow prints date32 as YYYY-MM-DD)
+lineitem_full_df["Date"] = pd.to_datetime(lineitem_full_df["Date"], errors="coerce")
 
-lineitem_full_df.to_csv('./data_full/LineItemSales.csv', index=False)
+lineitem_table = pa.Table.from_pandas(lineitem_full_df, preserve_index=False)
+date_col = lineitem_table.schema.get_field_index('Date')
+lineitem_table = lineitem_table.set_column(
+    date_col, 'Date', lineitem_table['Date'].cast(pa.date32())
+)
+pacsv.write_csv(lineitem_table, './data_full/LineItemSales.csv')
 
 # Location establishment years
 # LOAD
@@ -68,124 +73,111 @@ def generate_inventory_dataframe(line_items_df, y1=2017, y2=2025, num_items=64):
     - num_items: Total number of items (1 to num_items)
     """
     
-    # Convert Date column to datetime
-    line_items_df['Date'] = pd.to_datetime(line_items_df['Date'])
+    # Date is already datetime64 from the load step; derive the month bucket
     line_items_df['Month'] = line_items_df['Date'].dt.to_period('M').dt.to_timestamp()
+
+    # LocationID is ~15 distinct strings; integer-coded categories make the
+    # groupby, pivot, and reindex keys below hash ints instead of strings
+    loc_dtype = pd.CategoricalDtype(sorted(location_years))
+    line_items_df['LocationID'] = line_items_df['LocationID'].astype(loc_dtype)
     
-    # Calculate sales by month, location, and item
-    sales_summary = line_items_df.groupby(['Month', 'LocationID', 'ItemID'])['Qty'].sum().reset_index()
-    sales_summary.columns = ['Month', 'LocationID', 'ItemID', 'SoldQty']
+    # Calculate sales by month, location, and item, kept as a MultiIndexed
+    # Series so the grid lookup below is a reindex gather rather than a merge
+    sales_summary = line_items_df.groupby(['Month', 'LocationID', 'ItemID'])['Qty'].sum()
     
     # Generate date range
     date_range = pd.date_range(start=f'{y1}-01-01', end=f'{y2}-12-01', freq='MS')
     
-    # Create all combinations of dates, locations, and items
-    # But only include locations that were open in that month
-    records = []
-    
-    for date in date_range:
-        year = date.year
-        month = date.month
-        
-        # Determine which locations are open
-        open_locations = [loc for loc, est_year in location_years.items() 
-                         if est_year <= year or (est_year == year and month >= 1)]
-        
-        for location in open_locations:
-            for item_id in range(1, num_items + 1):
-                records.append({
-                    'Month': date,
-                    'LocationID': location,
-                    'ItemID': item_id
-                })
-    
-    # Create base dataframe
-    inventory_df = pd.DataFrame(records)
-    
-    # Merge with sales data
-    inventory_df = inventory_df.merge(sales_summary, 
-                                      on=['Month', 'LocationID', 'ItemID'], 
-                                      how='left')
-    inventory_df['SoldQty'] = inventory_df['SoldQty'].fillna(0).astype(int)
+    # Create all combinations of dates, locations, and items as one
+    # cross-product, then keep only rows where the location was already open
+    loc_years = pd.Series(location_years)
+    idx = pd.MultiIndex.from_product(
+        [date_range, pd.Categorical(sorted(location_years), dtype=loc_dtype),
+         range(1, num_items + 1)],
+        names=['Month', 'LocationID', 'ItemID']
+    )
+    idx = idx[
+        idx.get_level_values('Month').year
+        >= idx.get_level_values('LocationID').map(loc_years)
+    ]
+    inventory_df = idx.to_frame(index=False)
+
+    # Align sales onto the grid: months with no sales for a series become 0
+    inventory_df['SoldQty'] = (
+        sales_summary.reindex(idx, fill_value=0).to_numpy().astype(int)
+    )
     
     # Sort by location, item, and month
     inventory_df = inventory_df.sort_values(['LocationID', 'ItemID', 'Month']).reset_index(drop=True)
     
     # Set inventory parameters
     # Different items might have different thresholds; here we'll use item-based variation
-    np.random.seed(1234)
-    item_thresholds = {item_id: np.random.randint(30, 100) for item_id in range(1, num_items + 1)}
-    
-    # Initialize columns
-    inventory_df['BeginningOnHand'] = 0
-    inventory_df['PurchasedQty'] = 0
-    inventory_df['AdjustmentsQty'] = 0
-    
-    # Calculate inventory movements month by month
-    for idx, row in inventory_df.iterrows():
-        location = row['LocationID']
-        item_id = row['ItemID']
-        month = row['Month']
-        sold_qty = row['SoldQty']
-        
-        threshold = item_thresholds[item_id]
-        
-        # Check if this is the first month for this location-item combination
-        prev_rows = inventory_df[
-            (inventory_df['LocationID'] == location) & 
-            (inventory_df['ItemID'] == item_id) & 
-            (inventory_df['Month'] < month)
-        ]
-        
-        if len(prev_rows) == 0:
-            # First month: start with initial stock
-            beginning_on_hand = threshold # will need to hardcode to include 2022
-            inventory_df.at[idx, 'BeginningOnHand'] = beginning_on_hand
-        else:
-            # Get ending inventory from previous month
-            prev_idx = prev_rows.index[-1]
-            prev_row = inventory_df.loc[prev_idx]
-            beginning_on_hand = (prev_row['BeginningOnHand'] + 
-                               prev_row['PurchasedQty'] - 
-                               prev_row['SoldQty'] + 
-                               prev_row['AdjustmentsQty'])
-            inventory_df.at[idx, 'BeginningOnHand'] = max(0, beginning_on_hand)
-        
-        # Calculate purchases: top up if below 20% of threshold
-        current_stock = inventory_df.at[idx, 'BeginningOnHand']
-        
-        if current_stock < threshold * 0.2:
-            # Purchase enough to reach threshold
-            purchase_qty = threshold - current_stock
-            inventory_df.at[idx, 'PurchasedQty'] = purchase_qty
-        else:
-            inventory_df.at[idx, 'PurchasedQty'] = 0
-        
-        # Add random adjustments (shrink, damage, corrections)
-        # Small probability of adjustments, can be positive or negative
-        if np.random.random() < 0.15:  # 15% chance of adjustment
-            # Adjustments typically small, mostly negative (shrink/damage)
-            adjustment = np.random.choice(
-                [-5, -4, -3, -2, -1, 0, 1, 2], 
-                p=[0.1, 0.15, 0.2, 0.25, 0.15, 0.05, 0.05, 0.05]
-            )
-            inventory_df.at[idx, 'AdjustmentsQty'] = adjustment
-        else:
-            inventory_df.at[idx, 'AdjustmentsQty'] = 0
+    rng = np.random.default_rng(1234)
+    item_thresholds = {item_id: rng.integers(30, 100) for item_id in range(1, num_items + 1)}
+
+    # ------------------------------------------------------------------
+    # Vectorized inventory state machine
+    # ------------------------------------------------------------------
+    # Pivot SoldQty into an (n_months, n_series) matrix where each column is
+    # one (LocationID, ItemID) series; the recurrence then only loops over
+    # months (~100 iterations) with whole-array updates, instead of a Python
+    # pass per row with a full-frame mask lookup for the previous month.
+    pivot = inventory_df.pivot_table(index='Month', columns=['LocationID', 'ItemID'],
+                                     values='SoldQty', fill_value=0)
+    sold = pivot.to_numpy()
+    n_months, n_series = sold.shape
+
+    # Per-series threshold and opening-month index (locations open in January)
+    thresholds = np.array([item_thresholds[item] for _, item in pivot.columns])
+    open_idx = np.array([
+        max(0, (location_years[loc] - y1) * 12) for loc, _ in pivot.columns
+    ])
+
+    # Pre-draw all random adjustments in one shot (15% chance per cell)
+    adj_mask = rng.random((n_months, n_series)) < 0.15
+    adj_vals = rng.choice(
+        [-5, -4, -3, -2, -1, 0, 1, 2],
+        size=(n_months, n_series),
+        p=[0.1, 0.15, 0.2, 0.25, 0.15, 0.05, 0.05, 0.05]
+    )
+    adj = np.where(adj_mask, adj_vals, 0)
+
+    begin = np.zeros((n_months, n_series), dtype=np.int64)
+    purch = np.zeros((n_months, n_series), dtype=np.int64)
+
+    for m in range(n_months):
+        # Series opening this month start with initial stock at the threshold
+        opening = open_idx == m
+        begin[m, opening] = thresholds[opening]
+
+        # Already-open series carry last month's ending inventory forward
+        if m > 0:
+            running = open_idx < m
+            carried = (begin[m - 1, running] + purch[m - 1, running]
+                       - sold[m - 1, running] + adj[m - 1, running])
+            begin[m, running] = np.maximum(0, carried)
+
+        # Top up to the threshold wherever stock fell below 20% of it
+        low = (open_idx <= m) & (begin[m] < thresholds * 0.2)
+        purch[m, low] = thresholds[low] - begin[m, low]
+
+    # Gather the matrix results back onto the row-oriented frame
+    row_pos = pivot.index.get_indexer(inventory_df['Month'])
+    col_pos = pivot.columns.get_indexer(
+        pd.MultiIndex.from_arrays([inventory_df['LocationID'], inventory_df['ItemID']])
+    )
+    inventory_df['BeginningOnHand'] = begin[row_pos, col_pos]
+    inventory_df['PurchasedQty'] = purch[row_pos, col_pos]
+    inventory_df['AdjustmentsQty'] = adj[row_pos, col_pos]
     
     # Convert Month to string format YYYY-MM-01
     inventory_df['Month'] = inventory_df['Month'].dt.strftime('%Y-%m-%d')
     
-    # Ensure proper column order and data types
-    inventory_df = inventory_df[['Month', 'LocationID', 'ItemID', 'BeginningOnHand', 
+    # Ensure proper column order; all quantity columns are already integer
+    # arrays straight from the matrix buffers, so no dtype fixups needed
+    inventory_df = inventory_df[['Month', 'LocationID', 'ItemID', 'BeginningOnHand',
                                  'PurchasedQty', 'SoldQty', 'AdjustmentsQty']]
-    
-    inventory_df['ItemID'] = inventory_df['ItemID'].astype(int)
-    inventory_df['BeginningOnHand'] = inventory_df['BeginningOnHand'].astype(int)
-    inventory_df['PurchasedQty'] = inventory_df['PurchasedQty'].astype(int)
-    inventory_df['SoldQty'] = inventory_df['SoldQty'].astype(int)
-    inventory_df['AdjustmentsQty'] = inventory_df['AdjustmentsQty'].astype(int)
-    
+
     return inventory_df
 
 
@@ -213,5 +205,6 @@ if __name__ == "__main__":
     }))
     
     
-inventory_df.to_csv('./data_full/Inventory.csv', index=False)
+pacsv.write_csv(pa.Table.from_pandas(inventory_df, preserve_index=False),
+                './data_full/Inventory.csv')
 
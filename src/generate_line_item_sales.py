@@ -3,82 +3,58 @@ import numpy as np
 
 # fix date string for concate
 
-np.random.seed(1234)
+rng = np.random.default_rng(1234)
 
 
 lineitem_df = pd.read_csv('data_original/LineItemSales.csv')
-orders_df = pd.read_excel('data_new/newOrderInfo.xlsx')
+orders_df = pd.read_parquet('data_new/newOrderInfo.parquet')
 
 
-# Initialize list to store line items
+# Initialize line item ID counter
 line_item_id = int(lineitem_df["LineItemID"].max())
 
-
-line_items = []
-for _, order in orders_df.iterrows():
-    order_id = order['OrderID']
-    date = order['Date']
-    location = order['LocationID']
-    
-    # Generate 1-5 line items per order
-    num_line_items = np.random.randint(1, 6)
-    
-    # Track items already added to this order to avoid duplicates
-    items_in_order = set()
-    
-    for _ in range(num_line_items):
-        # Generate ItemID with weighted probability
-        # Items 1-53 are common, 54-61 are much less common
-        if np.random.random() < 0.90:  # 90% chance for items 1-53
-            item_id = np.random.randint(1, 54)
-        else:  # 10% chance for items 54-61
-            item_id = np.random.randint(54, 62)
-        
-        # Avoid duplicate items in the same order
-        while item_id in items_in_order:
-            if np.random.random() < 0.90:
-                item_id = np.random.randint(1, 54)
-            else:
-                item_id = np.random.randint(54, 62)
-        
-        items_in_order.add(item_id)
-        
-        # Generate Quantity based on ItemID
-        if 1 <= item_id <= 21:
-            quantity = np.random.randint(1, 2)  # Strictly 1 for items 1-21
-        else:
-            if np.random.random() < 0.96:
-                quantity = np.random.randint(1, 2)
-            else:    
-                quantity = np.random.randint(2, 6)  # 2-5 for other items
-        
-        # Generate DiscountID with specified probabilities
-        discount_rand = np.random.random()
-        if discount_rand < 0.02:  # 2% chance
-            discount_id = 'D1'
-        elif discount_rand < 0.04:  # 2% chance
-            discount_id = 'D2'
-        elif discount_rand < 0.05:  # 1% chance
-            discount_id = 'D3'
-        else:  # 95% chance
-            discount_id = None
-        
-        # Create line item
-        line_items.append({
-            'LineItemID': line_item_id,
-            'OrderID': order_id,
-            'ItemID': item_id,
-            'Qty': quantity,
-            'DiscountID': discount_id,
-            'Date': date,
-            'LocationID': location
-        })
-
-        
-        line_item_id += 1
-
-# Create DataFrame
-line_items_df = pd.DataFrame(line_items)
+# Generate 1-5 line items per order, then explode the order columns so every
+# draw below is a single bulk np.random call over the flat array
+num_line_items = rng.integers(1, 6, len(orders_df))
+total = num_line_items.sum()
+
+order_ids = np.repeat(orders_df['OrderID'].to_numpy(), num_line_items)
+dates = np.repeat(orders_df['Date'].to_numpy(), num_line_items)
+locations = np.repeat(orders_df['LocationID'].to_numpy(), num_line_items)
+
+# Generate ItemID with weighted probability
+# Items 1-53 are common, 54-61 are much less common (90% / 10% split)
+is_common = rng.random(total) < 0.90
+item_ids = np.where(is_common,
+                    rng.integers(1, 54, total),
+                    rng.integers(54, 62, total))
+
+# Generate Quantity based on ItemID: strictly 1 for items 1-21,
+# 2-5 for other items 4% of the time
+quantities = np.ones(total, dtype=int)
+bulk = (item_ids > 21) & (rng.random(total) >= 0.96)
+quantities[bulk] = rng.integers(2, 6, bulk.sum())
+
+# Generate DiscountID with specified probabilities:
+# 2% D1, 2% D2, 1% D3, 95% no discount
+discount_labels = np.array(['D1', 'D2', 'D3', None], dtype=object)
+discount_ids = discount_labels[
+    np.searchsorted([0.02, 0.04, 0.05], rng.random(total), side='right')
+]
+
+# Create DataFrame, dropping duplicate items within the same order
+line_items_df = pd.DataFrame({
+    'OrderID': order_ids,
+    'ItemID': item_ids,
+    'Qty': quantities,
+    'DiscountID': discount_ids,
+    'Date': dates,
+    'LocationID': locations
+}).drop_duplicates(subset=['OrderID', 'ItemID'], ignore_index=True)
+
+line_items_df.insert(
+    0, 'LineItemID', np.arange(line_item_id, line_item_id + len(line_items_df))
+)
 
 # Display results
 print(f"Generated {len(line_items_df)} line items for {len(orders_df)} orders")
@@ -99,8 +75,13 @@ print(f"  Items 54-61: {len(line_items_df[line_items_df['ItemID'] >= 54])}")
 print(f"\nDiscount distribution:")
 print(line_items_df['DiscountID'].value_counts(dropna=False))
 
-line_items_df.drop_duplicates(subset=["LineItemID", "OrderID"]) \
-    .to_csv('./data_new/newLineItemSales.csv', index=False)
+# LineItemIDs come from one arange block, so (LineItemID, OrderID) is unique
+# by construction and needs no dedupe pass before writing
+line_items_df.to_csv('./data_new/newLineItemSales.csv', index=False)
+# Parquet sibling of the data_new deliverable — downstream stages reload this
+# instead of re-parsing the CSV
+line_items_df.to_parquet('./data_new/newLineItemSales.parquet',
+                         engine='pyarrow', compression='zstd')
 
 
 
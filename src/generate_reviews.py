@@ -2,13 +2,14 @@
 import pandas as pd
 import numpy as np
 import argparse
+import os
 from pathlib import Path
-from datetime import datetime, timedelta
-import random
+from datetime import datetime
+from concurrent.futures import ProcessPoolExecutor
 
-# Initialize random seeds for reproducibility
-random.seed(1234)
-np.random.seed(1234)
+# Base seed; each year derives its own Generator from [RANDOM_SEED, year] so
+# parallel runs stay reproducible regardless of worker scheduling
+RANDOM_SEED = 1234
 
 
 
@@ -44,17 +45,19 @@ def generate_reviews_master_map(start_year, num_years):
     
     return reviews_by_year_master
 
-def generate_reviews(year, num_reviews):
+def generate_reviews(year, num_reviews, rng):
     """
     Generate Reviews data for a given year
-    
+
     Parameters:
     -----------
     year : int
         Year for the data (2023, 2024, or 2025)
     num_reviews : int
         Number of reviews to generate
-    
+    rng : numpy.random.Generator
+        Seeded random generator for this year
+
     Returns:
     --------
     pandas.DataFrame
@@ -78,48 +81,76 @@ def generate_reviews(year, num_reviews):
         10: 0.20
     }
     
-    data = []
-    
     # Date range for the year
     start_date = datetime(year, 1, 1)
     end_date = datetime(year, 12, 31)
     days_in_year = (end_date - start_date).days + 1
-    
-    for _ in range(num_reviews):
-        # Generate random date within the year
-        random_days = random.randint(0, days_in_year - 1)
-        date_reviewed = start_date + timedelta(days=random_days)
-        date_str = date_reviewed.strftime("%-m/%-d/%Y")
-        
-        # Generate rating based on distribution
-        rating = np.random.choice(
-            list(rating_probs.keys()),
-            p=list(rating_probs.values())
-        )
-        
-        # Generate platform based on distribution
-        platform = np.random.choice(
-            list(platform_probs.keys()),
-            p=list(platform_probs.values())
-        )
-        
-        data.append({
-            'Date': date_str,
-            'Rating': rating,
-            'Platform': platform
-        })
-    
-    # Create DataFrame and sort by date
-    df = pd.DataFrame(data)
-    df['date_sort'] = pd.to_datetime(df['Date'])
-    df = df.sort_values('date_sort').drop('date_sort', axis=1).reset_index(drop=True)
-    
-    return df
+
+    # Generate all random dates, ratings, and platforms in one bulk draw each.
+    # Sorting the day offsets here orders the frame chronologically without
+    # the old string -> datetime re-parse of the formatted Date column.
+    random_days = np.sort(rng.integers(0, days_in_year, num_reviews))
+    dates = pd.Timestamp(start_date) + pd.to_timedelta(random_days, unit='D')
+
+    # Draw from the weight tables by inverting the cumulative probabilities,
+    # skipping np.random.choice's per-call validation and alias setup
+    rating_keys = np.array(list(rating_probs.keys()))
+    rating_cum = np.cumsum(list(rating_probs.values()))
+    ratings = rating_keys[np.searchsorted(rating_cum, rng.random(num_reviews))]
+
+    platform_keys = np.array(list(platform_probs.keys()))
+    platform_cum = np.cumsum(list(platform_probs.values()))
+    platforms = platform_keys[np.searchsorted(platform_cum, rng.random(num_reviews))]
+
+    # Rows are already in date order thanks to the sorted offsets
+    return pd.DataFrame({
+        'Date': dates.strftime("%-m/%-d/%Y"),
+        'Rating': ratings,
+        'Platform': platforms
+    })
+
+
+def generate_year(year, num_reviews):
+    """Generate and write one year's reviews; runs in a worker process."""
+    rng = np.random.default_rng([RANDOM_SEED, year])
+    df = generate_reviews(year, num_reviews, rng)
+
+    # Save to CSV
+    filename = f"{year}reviews.csv"
+
+    # Serialize once, hardlink the second copy instead of re-encoding
+    full_path = f'./data_full/Reviews/{filename}'
+    new_path = f'./data_new/Reviews/{filename}'
+    df.to_csv(full_path, index=False)
+    if os.path.exists(new_path):
+        os.remove(new_path)
+    os.link(full_path, new_path)
+
+    # Build the summary block; printed by the parent so years stay in order
+    lines = [f"  ✓ Created {filename}",
+             f"    - Total reviews: {len(df):,}"]
+
+    # Platform distribution
+    platform_counts = df['Platform'].value_counts()
+    for platform in ['Facebook', 'Yelp', 'Google']:
+        count = platform_counts.get(platform, 0)
+        pct = (count / len(df)) * 100
+        lines.append(f"    - {platform}: {count:,} ({pct:.1f}%)")
+
+    # Rating distribution
+    rating_counts = df['Rating'].value_counts().sort_index()
+    avg_rating = df['Rating'].mean()
+    lines.append(f"    - Average rating: {avg_rating:.2f}")
+    dist = "".join(f" {rating}★:{rating_counts.get(rating, 0)}"
+                   for rating in sorted(df['Rating'].unique()))
+    lines.append(f"    - Rating distribution:{dist}\n")
+
+    return "\n".join(lines)
 
 
 def main():
     """Generate Reviews files for 2023, 2024, and 2025"""
-    
+
     # Review counts following the pattern
     # 2017=209, 2018=776, 2019=1298, 2020=2088, 2021=2878, 2022=2919
     # Continuing the growth (slowing down as maturity increases):
@@ -138,43 +169,18 @@ def main():
 
     start_year = args.start_year
     no_years = args.no_years
-    
+
     reviews_by_year_master = generate_reviews_master_map(start_year, no_years)
+    years = list(range(start_year, start_year + no_years))
+    counts = [reviews_by_year_master[year] for year in years]
 
-    for i in range(start_year, start_year + no_years):
-        year = i
-        num_reviews = reviews_by_year_master[year]
+    for year, num_reviews in zip(years, counts):
         print(f"Generating {year}reviews.csv with {num_reviews:,} reviews...")
-        
-        # Generate data
-        df = generate_reviews(year, num_reviews)
-        
-        # Save to CSV
-        filename = f"{year}reviews.csv"
-
-        df.to_csv(f'./data_full/Reviews/{filename}', index=False)
-        df.to_csv(f'./data_new/Reviews/{filename}', index=False)
-        
-        # Print summary statistics
-        print(f"  ✓ Created {filename}")
-        print(f"    - Total reviews: {len(df):,}")
-        
-        # Platform distribution
-        platform_counts = df['Platform'].value_counts()
-        for platform in ['Facebook', 'Yelp', 'Google']:
-            count = platform_counts.get(platform, 0)
-            pct = (count / len(df)) * 100
-            print(f"    - {platform}: {count:,} ({pct:.1f}%)")
-        
-        # Rating distribution
-        rating_counts = df['Rating'].value_counts().sort_index()
-        avg_rating = df['Rating'].mean()
-        print(f"    - Average rating: {avg_rating:.2f}")
-        print(f"    - Rating distribution:", end="")
-        for rating in sorted(df['Rating'].unique()):
-            count = rating_counts.get(rating, 0)
-            print(f" {rating}★:{count}", end="")
-        print("\n")
+
+    # Years are independent, so generate them in parallel worker processes
+    with ProcessPoolExecutor() as executor:
+        for summary in executor.map(generate_year, years, counts):
+            print(summary)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
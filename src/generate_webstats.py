@@ -5,14 +5,15 @@ Generates realistic web analytics data for configurable year ranges
 import pandas as pd
 import numpy as np
 import argparse
+import os
 from pathlib import Path
-from datetime import datetime, timedelta
-import random
+from datetime import datetime
+from concurrent.futures import ProcessPoolExecutor
 
 
-# Initialize
-random.seed(1234)
-np.random.seed(1234)
+# Base seed; each year derives its own Generator from [RANDOM_SEED, year] so
+# parallel runs stay reproducible regardless of worker scheduling
+RANDOM_SEED = 1234
 
 
 def calculate_sessions(year, start_year, base_sessions, growth_rate):
@@ -98,10 +99,10 @@ def calculate_conversion_rate(year, start_year, base_conversion, conversion_impr
     return base_conversion + (conversion_improvement * years_elapsed)
 
 
-def generate_webstats(year, num_sessions, device_distribution, base_conversion_rate):
+def generate_webstats(year, num_sessions, device_distribution, base_conversion_rate, rng):
     """
     Generate WebStats data for a given year
-    
+
     Parameters:
     -----------
     year : int
@@ -112,76 +113,92 @@ def generate_webstats(year, num_sessions, device_distribution, base_conversion_r
         Distribution of device types
     base_conversion_rate : float
         Base conversion rate for the year
-    
+    rng : numpy.random.Generator
+        Seeded random generator for this year
+
     Returns:
     --------
     pandas.DataFrame
         WebStats data with all required columns
     """
     
-    data = []
-    
-    for user_id in range(1, num_sessions + 1):
-        # Generate device type based on year-specific distribution
-        device_type = np.random.choice(
-            list(device_distribution.keys()), 
-            p=list(device_distribution.values())
-        )
-        
-        # Generate browser 
-        browser = np.random.choice(
-            ['Chrome', 'Safari', 'Firefox', 'Edge'],
-            p=[0.26, 0.25, 0.25, 0.24]
-        )
-        
-        # Generate page views (most sessions have fewer pages)
-        if random.random() < 0.7:
-            page_views = random.randint(50, 3000)
-        else:
-            page_views = random.randint(3000, 10000)
-        
-        # Generate time on page (seconds)
-        time_on_page = random.randint(40, 3500)
-        
-        # Generate conversion rate with high variance
-        conversion_rate = base_conversion_rate + np.random.uniform(-40, 40)
-        conversion_rate = np.clip(conversion_rate, 0, 100)
-        conversion_rate = round(conversion_rate, 2)
-        
-        # Generate bounce rate
-        bounce_rate = round(np.random.uniform(0, 95), 2)
-        
-        # Generate date within the year
-        start_date = datetime(year, 1, 1)
-        end_date = datetime(year, 12, 31)
-        days_in_year = (end_date - start_date).days + 1
-        random_days = random.randint(0, days_in_year - 1)
-        date_visited = start_date + timedelta(days=random_days)
-        date_visited_str = date_visited.strftime("%-m/%-d/%Y")
-        
-        # Generate time of day
-        hour = random.randint(0, 23)
-        minute = random.randint(0, 59)
-        period = "AM" if hour < 12 else "PM"
-        display_hour = hour if hour <= 12 else hour - 12
-        if display_hour == 0:
-            display_hour = 12
-        time_of_day = f"{display_hour}:{minute:02d} {period}"
-        
-        # Append row
-        data.append({
-            'user_id': user_id,
-            'page_views': page_views,
-            'time_on_page': time_on_page,
-            'device_type': device_type,
-            'browser': browser,
-            'conversion_rate': conversion_rate,
-            'bounce_rate': bounce_rate,
-            'date_visited': date_visited_str,
-            'time_of_day_visited': time_of_day
-        })
-    
-    return pd.DataFrame(data)
+    n = num_sessions
+
+    # Generate device type based on year-specific distribution, inverting the
+    # cumulative probabilities instead of paying np.random.choice's setup
+    device_keys = np.array(list(device_distribution.keys()))
+    device_cum = np.cumsum(list(device_distribution.values()))
+    device_type = device_keys[np.searchsorted(device_cum, rng.random(n))]
+
+    # Generate browser
+    browser_keys = np.array(['Chrome', 'Safari', 'Firefox', 'Edge'])
+    browser_cum = np.cumsum([0.26, 0.25, 0.25, 0.24])
+    browser = browser_keys[np.searchsorted(browser_cum, rng.random(n))]
+
+    # Generate page views (most sessions have fewer pages)
+    page_views = np.where(rng.random(n) < 0.7,
+                          rng.integers(50, 3001, n),
+                          rng.integers(3000, 10001, n))
+
+    # Generate time on page (seconds)
+    time_on_page = rng.integers(40, 3501, n)
+
+    # Generate conversion rate with high variance
+    conversion_rate = np.clip(
+        base_conversion_rate + rng.uniform(-40, 40, n), 0, 100
+    ).round(2)
+
+    # Generate bounce rate
+    bounce_rate = rng.uniform(0, 95, n).round(2)
+
+    # Generate dates within the year
+    start_date = datetime(year, 1, 1)
+    end_date = datetime(year, 12, 31)
+    days_in_year = (end_date - start_date).days + 1
+    random_days = rng.integers(0, days_in_year, n)
+    dates_visited = pd.Timestamp(start_date) + pd.to_timedelta(random_days, unit='D')
+
+    # Generate time of day via small label lookups (12-hour clock, 0 -> 12)
+    hours = rng.integers(0, 24, n)
+    minutes = rng.integers(0, 60, n)
+    hour_labels = np.array(
+        [str(h - 12 if h > 12 else (12 if h == 0 else h)) for h in range(24)]
+    )
+    minute_labels = np.array([f":{m:02d}" for m in range(60)])
+    period = np.where(hours < 12, ' AM', ' PM')
+    time_of_day = np.char.add(
+        np.char.add(hour_labels[hours], minute_labels[minutes]), period
+    )
+
+    return pd.DataFrame({
+        'user_id': np.arange(1, n + 1),
+        'page_views': page_views,
+        'time_on_page': time_on_page,
+        'device_type': device_type,
+        'browser': browser,
+        'conversion_rate': conversion_rate,
+        'bounce_rate': bounce_rate,
+        'date_visited': dates_visited.strftime("%-m/%-d/%Y"),
+        'time_of_day_visited': time_of_day
+    })
+
+
+def generate_year(year, num_sessions, device_distribution, base_conversion, output_dir):
+    """Generate and write one year's webstats; runs in a worker process."""
+    rng = np.random.default_rng([RANDOM_SEED, year])
+    df = generate_webstats(year, num_sessions, device_distribution,
+                           base_conversion, rng)
+
+    filename = f"WebStats{year}.csv"
+    # Serialize once, hardlink the second copy instead of re-encoding
+    full_path = f'{output_dir}{filename}'
+    new_path = f'./data_new/WebStats/{filename}'
+    df.to_csv(full_path, index=False)
+    if os.path.exists(new_path):
+        os.remove(new_path)
+    os.link(full_path, new_path)
+
+    return f"  ✓ Created {filename}"
 
 
 def main(start_year=2023, num_years=3, output_dir='./data_full/WebStats/'):
@@ -233,49 +250,51 @@ def main(start_year=2023, num_years=3, output_dir='./data_full/WebStats/'):
     
     print(f"Generating WebStats data for {num_years} years starting from {start_year}")
     print("=" * 70)
-    
+
+    # Calculate the cheap year-specific parameters up front, then dispatch the
+    # independent per-year generation to worker processes
+    years, sessions, distributions, conversions = [], [], [], []
     for i in range(num_years):
         year = start_year + i
-        
-        # Calculate year-specific parameters
+
         num_sessions = calculate_sessions(
-            year, 
+            year,
             start_year=2022,
             base_sessions=base_sessions_2022,
             growth_rate=sessions_growth_rate
         )
-        
+
         device_distribution = calculate_mobile_share(
             year,
             start_year=2022,
             base_mobile_share=base_mobile_share_2022,
             mobile_growth_rate=mobile_annual_growth
         )
-        
+
         base_conversion = calculate_conversion_rate(
             year,
             start_year=2022,
             base_conversion=base_conversion_2022,
             conversion_improvement=conversion_annual_improvement
         )
-        
+
         print(f"\nYear {year}:")
         print(f"  Sessions: {num_sessions:,}")
         print(f"  Device distribution: Mobile {device_distribution['mobile']:.1%}, "
               f"Desktop {device_distribution['desktop']:.1%}, "
               f"Tablet {device_distribution['tablet']:.1%}")
         print(f"  Base conversion rate: {base_conversion:.1f}%")
-        
-        # Generate data
-        df = generate_webstats(year, num_sessions, device_distribution, base_conversion)
-        
-        # Save to CSV
-        filename = f"WebStats{year}.csv"
-        df.to_csv(f'{output_dir}{filename}', index=False)
-        df.to_csv(f'./data_new/WebStats/{filename}', index=False)
-        
-        print(f"  ✓ Created {filename}")
-    
+
+        years.append(year)
+        sessions.append(num_sessions)
+        distributions.append(device_distribution)
+        conversions.append(base_conversion)
+
+    with ProcessPoolExecutor() as executor:
+        for created in executor.map(generate_year, years, sessions, distributions,
+                                    conversions, [output_dir] * len(years)):
+            print(created)
+
     print("\n" + "=" * 70)
     print("All files generated successfully!")
 
@@ -3,8 +3,9 @@ import numpy as np
 from datetime import datetime, timedelta
 import os
 
-# Set random seed for reproducibility
-np.random.seed(42)
+# Seeded Generator for reproducibility (faster draws than the legacy
+# np.random.* global-state API)
+rng = np.random.default_rng(42)
 
 # ============================================================================
 # 1. LOAD DATA
@@ -16,10 +17,10 @@ print("Loading data files...")
 df_main = pd.read_excel('./data_original/Ace_Bikes_Data.xlsx', sheet_name='Data')
 
 # Load new employees
-df_new_employees = pd.read_excel('./data_new/newEmployees.xlsx')
+df_new_employees = pd.read_parquet('./data_new/newEmployees.parquet')
 
 # Load new line item sales
-df_new_line_items = pd.read_csv('./data_new/newLineItemSales.csv')
+df_new_line_items = pd.read_parquet('./data_new/newLineItemSales.parquet')
 
 print(f"Loaded {len(df_new_employees)} new employees")
 print(f"Loaded {len(df_new_line_items)} new line items")
@@ -60,13 +61,15 @@ new_employee_dates = df_new_employees[['EmployeeID', 'StartDate', 'TerminationDa
 
 print(f"\nAppending {len(new_employee_dates)} employee records to EmployeeDates table")
 
-# Add new employee dates starting from the next available row
+# Add new employee dates starting from the next available row, as one block
+# assignment instead of four scalar .loc writes per record
 start_row = employee_dates_last_row + 1
-for idx, row in new_employee_dates.iterrows():
-    df_main.loc[start_row + idx, 'EmployeeID'] = row['EmployeeID']
-    df_main.loc[start_row + idx, 'StartDate'] = row['StartDate']
-    df_main.loc[start_row + idx, 'TerminationDate'] = row['TerminationDate']
-    df_main.loc[start_row + idx, 'LocationID'] = row['LocationID']
+end_row = start_row + len(new_employee_dates)
+if end_row > len(df_main):
+    df_main = df_main.reindex(range(end_row))
+df_main.loc[start_row:end_row - 1,
+            ['EmployeeID', 'StartDate', 'TerminationDate', 'LocationID']] = \
+    new_employee_dates.to_numpy()
 
 print(f"✓ Added {len(new_employee_dates)} employee date records")
 
@@ -78,103 +81,91 @@ print("\n" + "="*80)
 print("TASK 2: Generating employee skill reviews...")
 print("="*80)
 
-def generate_review_dates(start_date, end_date=None):
-    """Generate semi-annual review dates (January and July)"""
-    if pd.isna(start_date):
-        return []
-    
-    start = pd.to_datetime(start_date)
-    
+def generate_review_schedule(start_dates, end_dates):
+    """Build semi-annual review dates (January and July) for the whole cohort.
+
+    One shared array of jittered January/July anchor dates covers every year
+    in range; each employee's reviews are the anchors between their first
+    eligible period and their end date, located with searchsorted instead of
+    a per-employee while-loop of scalar pd.to_datetime calls.
+    """
     # If no end date, use current date (2023-12-31 as a reasonable end)
-    if pd.isna(end_date):
-        end = pd.to_datetime('2023-12-31')
-    else:
-        end = pd.to_datetime(end_date)
-    
-    review_dates = []
-    
-    # Start from the first review period after start date
-    # Reviews are in January (around 10th) and July (around 2nd-8th)
-    current_year = start.year
-    
-    # Check if started before July, add July review
-    if start <= pd.to_datetime(f'{current_year}-07-01'):
-        july_review = pd.to_datetime(f'{current_year}-07-{np.random.randint(2, 9)}')
-        if july_review >= start and july_review <= end:
-            review_dates.append(july_review)
-    
-    # Move to next January
-    current_year += 1
-    
-    while True:
-        # January review
-        jan_review = pd.to_datetime(f'{current_year}-01-{np.random.randint(9, 17)}')
-        if jan_review <= end:
-            review_dates.append(jan_review)
-        else:
-            break
-        
-        # July review
-        july_review = pd.to_datetime(f'{current_year}-07-{np.random.randint(1, 9)}')
-        if july_review <= end:
-            review_dates.append(july_review)
-        else:
-            break
-        
-        current_year += 1
-    
-    return review_dates
-
-
-def generate_rating(has_training, base_mean=3.5, base_std=0.8):
+    ends = end_dates.fillna(pd.Timestamp('2023-12-31'))
+    first_year = int(start_dates.dt.year.min())
+    last_year = 2023
+
+    # Reviews are in January (around 9th-16th) and July (around 1st-8th)
+    anchors = pd.DatetimeIndex([
+        pd.Timestamp(year, month, rng.integers(*day_range))
+        for year in range(first_year, last_year + 1)
+        for month, day_range in ((1, (9, 17)), (7, (1, 9)))
+    ])
+
+    # First eligible review: July of the hire year when hired by July 1,
+    # otherwise the following January
+    years = start_dates.dt.year
+    july1 = pd.to_datetime(pd.DataFrame({'year': years, 'month': 7, 'day': 1}))
+    next_jan = pd.to_datetime(pd.DataFrame({'year': years + 1, 'month': 1, 'day': 1}))
+    first_eligible = np.where(start_dates.values <= july1.values,
+                              july1.values, next_jan.values)
+
+    lo = np.searchsorted(anchors.values, first_eligible, side='left')
+    hi = np.searchsorted(anchors.values, ends.values, side='right')
+    counts = np.maximum(hi - lo, 0)
+
+    # Expand each employee's [lo, hi) anchor slice into flat index arrays
+    total = int(counts.sum())
+    emp_idx = np.repeat(np.arange(len(start_dates)), counts)
+    offsets = np.arange(total) - np.repeat(np.cumsum(counts) - counts, counts)
+    review_dates = anchors.values[np.repeat(lo, counts) + offsets]
+
+    return emp_idx, pd.DatetimeIndex(review_dates)
+
+
+def generate_ratings(has_training, base_means, base_std=0.8):
     """
-    Generate a rating score (1-5).
-    If employee has training, boost the mean rating.
+    Generate an (n_reviews, n_skills) matrix of rating scores (1-5).
+    Employees with the matching training get a boosted mean rating.
+
+    All five skill columns are drawn in one broadcast instead of five
+    separate uniform/normal/clip passes over the review count.
     """
-    if has_training:
-        # Training increases mean by 0.5-0.8 points
-        mean = base_mean + np.random.uniform(0.5, 0.8)
-    else:
-        mean = base_mean
-    
-    # Generate rating with some randomness
-    rating = np.random.normal(mean, base_std)
-    
-    # Clip to valid range and round to 1 decimal
-    rating = np.clip(rating, 2.0, 5.0)
-    return round(rating, 1)
-
-
-# Generate reviews for each new employee
-new_reviews = []
-
-for _, emp in df_new_employees.iterrows():
-    emp_id = emp['EmployeeID']
-    start_date = emp['StartDate']
-    termination_date = emp['TerminationDate']
-    
-    # Get training flags
-    skills_training = emp['SkillsTraining']
-    salesmanship_training = emp['SalesmanshipTraining']
-    product_training = emp['ProductTraining']
-    
-    # Generate review dates
-    review_dates = generate_review_dates(start_date, termination_date)
-    
-    # Generate reviews for each date
-    for review_date in review_dates:
-        review = {
-            'EmpID': emp_id,
-            'Date': review_date,
-            'Salesmanship': generate_rating(salesmanship_training, base_mean=3.4),
-            'ProductKnowledge': generate_rating(product_training, base_mean=3.6),
-            'TeamPlayer': generate_rating(skills_training, base_mean=3.7),
-            'Innovator': generate_rating(skills_training, base_mean=3.5),
-            'Satisfaction': generate_rating(skills_training, base_mean=3.3)
-        }
-        new_reviews.append(review)
-
-df_new_reviews = pd.DataFrame(new_reviews)
+    has_training = np.asarray(has_training, dtype=bool)
+
+    # Training increases mean by 0.5-0.8 points
+    means = base_means + rng.uniform(0.5, 0.8, has_training.shape) * has_training
+
+    # Generate ratings with some randomness, clipped to the valid range
+    ratings = rng.normal(means, base_std)
+    return np.clip(ratings, 2.0, 5.0).round(1)
+
+
+# Generate the review schedule for all new employees at once
+emp_idx, review_dates = generate_review_schedule(
+    df_new_employees['StartDate'], df_new_employees['TerminationDate']
+)
+reviewed = df_new_employees.iloc[emp_idx]
+
+# One column of training flags per skill, drawn as a single (n, 5) matrix
+has_training = np.stack([
+    reviewed['SalesmanshipTraining'],
+    reviewed['ProductTraining'],
+    reviewed['SkillsTraining'],
+    reviewed['SkillsTraining'],
+    reviewed['SkillsTraining']
+], axis=1)
+ratings = generate_ratings(has_training,
+                           base_means=np.array([3.4, 3.6, 3.7, 3.5, 3.3]))
+
+df_new_reviews = pd.DataFrame({
+    'EmpID': reviewed['EmployeeID'].to_numpy(),
+    'Date': review_dates,
+    'Salesmanship': ratings[:, 0],
+    'ProductKnowledge': ratings[:, 1],
+    'TeamPlayer': ratings[:, 2],
+    'Innovator': ratings[:, 3],
+    'Satisfaction': ratings[:, 4]
+})
 
 print(f"\nGenerated {len(df_new_reviews)} review records for {len(df_new_employees)} employees")
 print(f"Average reviews per employee: {len(df_new_reviews) / len(df_new_employees):.1f}")
@@ -183,16 +174,14 @@ print(f"Average reviews per employee: {len(df_new_reviews) / len(df_new_employee
 print("\nSample of generated reviews:")
 print(df_new_reviews.head(10))
 
-# Append to EmployeeReviewInfo table
+# Append to EmployeeReviewInfo table as one block assignment
 start_row = employee_review_last_row + 1
-for idx, row in df_new_reviews.iterrows():
-    df_main.loc[start_row + idx, 'EmpID'] = row['EmpID']
-    df_main.loc[start_row + idx, 'Date'] = row['Date']
-    df_main.loc[start_row + idx, 'Salesmanship'] = row['Salesmanship']
-    df_main.loc[start_row + idx, 'ProductKnowledge'] = row['ProductKnowledge']
-    df_main.loc[start_row + idx, 'TeamPlayer'] = row['TeamPlayer']
-    df_main.loc[start_row + idx, 'Innovator'] = row['Innovator']
-    df_main.loc[start_row + idx, 'Satisfaction'] = row['Satisfaction']
+end_row = start_row + len(df_new_reviews)
+if end_row > len(df_main):
+    df_main = df_main.reindex(range(end_row))
+review_cols = ['EmpID', 'Date', 'Salesmanship', 'ProductKnowledge',
+               'TeamPlayer', 'Innovator', 'Satisfaction']
+df_main.loc[start_row:end_row - 1, review_cols] = df_new_reviews[review_cols].to_numpy()
 
 print(f"✓ Added {len(df_new_reviews)} employee review records")
 
@@ -204,55 +193,56 @@ print("\n" + "="*80)
 print("TASK 3: Adding termination reasons...")
 print("="*80)
 
-# Find employees with termination dates
-terminated_employees = df_new_employees[df_new_employees['TerminationDate'].notna()]
-non_terminated_employees = df_new_employees[df_new_employees['TerminationDate'].isna()]
+# Find employees with termination dates; only the EmployeeID arrays are
+# materialized per group — no full-frame subset copies
+terminated_mask = df_new_employees['TerminationDate'].notna().to_numpy()
+terminated_ids = df_new_employees['EmployeeID'].to_numpy()[terminated_mask]
+active_ids = df_new_employees['EmployeeID'].to_numpy()[~terminated_mask]
+
+termination_frames = []
 
-termination_records = []
+if len(terminated_ids) > 0:
+    print(f"\nFound {len(terminated_ids)} terminated employees")
 
-if len(terminated_employees) > 0:
-    print(f"\nFound {len(terminated_employees)} terminated employees")
-    
     # Define termination reasons with probabilities
     reasons = ['Another Job', 'Moved', 'Terminated']
     probabilities = [0.50, 0.25, 0.25]
-    
-    # Generate random reasons for terminated employees
-    for _, emp in terminated_employees.iterrows():
-        reason = np.random.choice(reasons, p=probabilities)
-        termination_records.append({
-            'EmployeeID': emp['EmployeeID'],
-            'Reason': reason
-        })
-    
-    print(f"  ✓ Assigned termination reasons to {len(terminated_employees)} employees")
+
+    # Draw reasons for all terminated employees in one call
+    termination_frames.append(pd.DataFrame({
+        'EmployeeID': terminated_ids,
+        'Reason': rng.choice(reasons, size=len(terminated_ids), p=probabilities)
+    }))
+
+    print(f"  ✓ Assigned termination reasons to {len(terminated_ids)} employees")
 else:
     print("\nNo terminated employees found")
 
 # Add 'null' for non-terminated employees
-if len(non_terminated_employees) > 0:
-    print(f"\nFound {len(non_terminated_employees)} non-terminated employees")
-    
-    for _, emp in non_terminated_employees.iterrows():
-        termination_records.append({
-            'EmployeeID': emp['EmployeeID'],
-            'Reason': 'null'
-        })
-    
-    print(f"  ✓ Added 'null' reason for {len(non_terminated_employees)} active employees")
+if len(active_ids) > 0:
+    print(f"\nFound {len(active_ids)} non-terminated employees")
+
+    termination_frames.append(pd.DataFrame({
+        'EmployeeID': active_ids,
+        'Reason': np.full(len(active_ids), 'null')
+    }))
+
+    print(f"  ✓ Added 'null' reason for {len(active_ids)} active employees")
 
 # Create dataframe with all termination records
-df_terminations = pd.DataFrame(termination_records)
+df_terminations = pd.concat(termination_frames, ignore_index=True)
 
-# Append to EmployeeTerminationReasons table
+# Append to EmployeeTerminationReasons table as one block assignment
 start_row = employee_termination_last_row + 1
-for idx, row in df_terminations.iterrows():
-    df_main.loc[start_row + idx, 'EmployeeID.1'] = row['EmployeeID']
-    df_main.loc[start_row + idx, 'Reason'] = row['Reason']
+end_row = start_row + len(df_terminations)
+if end_row > len(df_main):
+    df_main = df_main.reindex(range(end_row))
+df_main.loc[start_row:end_row - 1, ['EmployeeID.1', 'Reason']] = \
+    df_terminations[['EmployeeID', 'Reason']].to_numpy()
 
 print(f"\n✓ Added {len(df_terminations)} total termination reason records")
 
-if len(terminated_employees) > 0:
+if len(terminated_ids) > 0:
     print("\nTermination reasons breakdown:")
     print(df_terminations['Reason'].value_counts())
 else:
@@ -267,7 +257,7 @@ print("TASK 4: Generating line item returns...")
 print("="*80)
 
 # Sample 4.5% to 5% of line items
-sample_rate = np.random.uniform(0.045, 0.050)
+sample_rate = rng.uniform(0.045, 0.050)
 n_returns = int(len(df_new_line_items) * sample_rate)
 
 print(f"\nSampling {sample_rate:.2%} of {len(df_new_line_items)} line items = {n_returns} returns")
@@ -275,30 +265,28 @@ print(f"\nSampling {sample_rate:.2%} of {len(df_new_line_items)} line items = {n
 # Randomly sample line items
 sampled_line_items = df_new_line_items.sample(n=n_returns, random_state=42)
 
-# Assign ReturnIDs with specified probabilities
+# Assign ReturnIDs with specified probabilities, drawn for all sampled
+# line items in one call rather than one scalar choice per row
 return_ids = ['R1', 'R2', 'R3']
 return_probabilities = [0.34, 0.34, 0.32]
 
-returns_data = []
-for _, item in sampled_line_items.iterrows():
-    return_id = np.random.choice(return_ids, p=return_probabilities)
-    returns_data.append({
-        'LineItemID': item['LineItemID'],
-        'ReturnID': return_id
-    })
-
-df_returns = pd.DataFrame(returns_data)
+df_returns = pd.DataFrame({
+    'LineItemID': sampled_line_items['LineItemID'].to_numpy(),
+    'ReturnID': rng.choice(return_ids, size=n_returns, p=return_probabilities)
+})
 
 print(f"\nReturn ID distribution:")
 print(df_returns['ReturnID'].value_counts().sort_index())
 print(f"\nPercentages:")
 print(df_returns['ReturnID'].value_counts(normalize=True).sort_index())
 
-# Append to LineItemReturns table
+# Append to LineItemReturns table as one block assignment
 start_row = line_item_returns_last_row + 1
-for idx, row in df_returns.iterrows():
-    df_main.loc[start_row + idx, 'LineItemID'] = row['LineItemID']
-    df_main.loc[start_row + idx, 'ReturnID'] = row['ReturnID']
+end_row = start_row + len(df_returns)
+if end_row > len(df_main):
+    df_main = df_main.reindex(range(end_row))
+df_main.loc[start_row:end_row - 1, ['LineItemID', 'ReturnID']] = \
+    df_returns[['LineItemID', 'ReturnID']].to_numpy()
 
 print(f"✓ Added {len(df_returns)} line item return records")
 
@@ -318,30 +306,17 @@ date_columns = ['StartDate', 'TerminationDate', 'Date', 'Date.1']
 
 for col in date_columns:
     if col in df_main.columns:
-        # For datetime columns, normalize to remove time component
-        df_main[col] = pd.to_datetime(df_main[col], errors='coerce')
-        # Normalize to midnight (removes time component)
-        df_main[col] = df_main[col].dt.normalize()
+        # Only parse columns that aren't already datetime64; the block
+        # appends above usually leave them object-typed on first run
+        if not pd.api.types.is_datetime64_any_dtype(df_main[col]):
+            df_main[col] = pd.to_datetime(df_main[col], errors='coerce')
+        # Truncate to day precision directly in numpy (cheaper than the
+        # modulo arithmetic behind dt.normalize)
+        df_main[col] = (
+            df_main[col].values.astype('datetime64[D]').astype('datetime64[ns]')
+        )
         print(f"  ✓ Normalized {col} to date-only format")
 
-# Rename columns that start with "Unnamed"
-print("\nRenaming 'Unnamed' columns...")
-
-unnamed_cols = [col for col in df_main.columns if str(col).startswith('Unnamed')]
-if unnamed_cols:
-    # Create a mapping of old names to new names (empty strings)
-    rename_dict = {col: '' for col in unnamed_cols}
-    
-    # However, pandas doesn't allow duplicate empty column names
-    # So we'll use a placeholder approach
-    for i, col in enumerate(unnamed_cols):
-        rename_dict[col] = f'__BLANK_{i}__'
-    
-    df_main.rename(columns=rename_dict, inplace=True)
-    print(f"  ✓ Renamed {len(unnamed_cols)} 'Unnamed' columns to blank placeholders")
-else:
-    print("  ✓ No 'Unnamed' columns found")
-
 # ============================================================================
 # 8. SAVE UPDATED FILE
 # ============================================================================
@@ -356,53 +331,23 @@ os.makedirs(output_dir, exist_ok=True)
 
 output_path = os.path.join(output_dir, 'newAce_Bikes_Data.xlsx')
 
-# Save to Excel with specific date format
+# Save to Excel with specific date format in a single pass: xlsxwriter's
+# engine-level datetime_format stamps every datetime cell as it streams out,
+# so no reopen/per-cell formatting pass is needed afterwards
 print(f"\nSaving to: {output_path}")
 
-# First, save the dataframe
-df_main.to_excel(output_path, sheet_name='Data', index=False)
-
-# Then, open with openpyxl to apply formatting
-from openpyxl import load_workbook
-from openpyxl.styles import numbers
-
-print("Applying date formatting to Excel...")
-
-wb = load_workbook(output_path)
-ws = wb['Data']
-
-# Clean up column headers - replace __BLANK_X__ with None
-for cell in ws[1]:
-    if cell.value and '__BLANK_' in str(cell.value):
-        cell.value = None
-
-# Find date columns and apply date-only formatting
-date_column_names = ['StartDate', 'TerminationDate', 'Date', 'Date.1']
-header_row = [cell.value for cell in ws[1]]
-
-date_column_indices = []
-for col_name in date_column_names:
-    if col_name in header_row:
-        col_idx = header_row.index(col_name) + 1  # openpyxl is 1-indexed
-        date_column_indices.append(col_idx)
-
-# Apply date-only format (yyyy-mm-dd) to all date columns
-for col_idx in date_column_indices:
-    col_letter = ws.cell(row=1, column=col_idx).column_letter
-    col_name = ws.cell(row=1, column=col_idx).value
-    
-    # Apply to all rows in this column (skip header)
-    for row in range(2, ws.max_row + 1):
-        cell = ws.cell(row=row, column=col_idx)
-        if cell.value is not None:
-            # Set number format to date only (no time)
-            cell.number_format = 'YYYY-MM-DD'
-    
-    print(f"  ✓ Applied date-only format to column {col_letter} ({col_name})")
-
-# Save the workbook
-wb.save(output_path)
-print(f"  ✓ Formatting applied successfully")
+with pd.ExcelWriter(output_path, engine='xlsxwriter',
+                    datetime_format='yyyy-mm-dd',
+                    date_format='yyyy-mm-dd') as writer:
+    df_main.to_excel(writer, sheet_name='Data', index=False,
+                     header=False, startrow=1)
+
+    # Write the header row directly, leaving the read_excel 'Unnamed' spacer
+    # columns blank — no rename to unique placeholders needed beforehand
+    worksheet = writer.sheets['Data']
+    for col_idx, col in enumerate(df_main.columns):
+        if not str(col).startswith('Unnamed'):
+            worksheet.write(0, col_idx, str(col))
 
 print("✓ File saved successfully!")
 
@@ -414,19 +359,22 @@ print("\n" + "="*80)
 print("SUMMARY REPORT")
 print("="*80)
 
+# Count the returns column once instead of one scan per ReturnID
+return_counts = df_returns['ReturnID'].value_counts()
+
 print(f"""
 Employee Updates:
   • New employees added: {len(new_employee_dates)}
   • Employee reviews generated: {len(df_new_reviews)}
-  • Termination reasons added: {len(terminated_employees)}
+  • Termination reasons added: {len(terminated_ids)}
 
 Line Item Updates:
   • Total line items: {len(df_new_line_items)}
   • Returns generated: {len(df_returns)} ({sample_rate:.2%})
   • Return distribution:
-    - R1: {(df_returns['ReturnID'] == 'R1').sum()} ({(df_returns['ReturnID'] == 'R1').mean():.1%})
-    - R2: {(df_returns['ReturnID'] == 'R2').sum()} ({(df_returns['ReturnID'] == 'R2').mean():.1%})
-    - R3: {(df_returns['ReturnID'] == 'R3').sum()} ({(df_returns['ReturnID'] == 'R3').mean():.1%})
+    - R1: {return_counts.get('R1', 0)} ({return_counts.get('R1', 0) / len(df_returns):.1%})
+    - R2: {return_counts.get('R2', 0)} ({return_counts.get('R2', 0) / len(df_returns):.1%})
+    - R3: {return_counts.get('R3', 0)} ({return_counts.get('R3', 0) / len(df_returns):.1%})
 
 Output:
   • File: newAce_Bikes_Data.xlsx